@@ -0,0 +1,21 @@
+# -*- coding: utf-8 -*-
+
+from .core import (
+    convert,
+    iter_entries,
+    load_prepared,
+    load_sheets,
+    match_distributions,
+    prepare,
+    write_json,
+)
+
+__all__ = [
+    "convert",
+    "iter_entries",
+    "load_prepared",
+    "load_sheets",
+    "match_distributions",
+    "prepare",
+    "write_json",
+]
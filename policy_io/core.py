@@ -0,0 +1,299 @@
+# -*- coding: utf-8 -*-
+
+import hashlib
+import json
+import os
+import re
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+import numpy as np
+import pandas as pd
+
+try:
+    import orjson
+except ImportError:  # stdlib fallback
+    orjson = None
+
+PLACEHOLDERS = frozenset({"", "-", "—", "–", "`", "nan", "NaN", "None"})
+CACHE_DIR_NAME = ".cache"
+ENTRY_CHUNK = 1000
+FLOAT_YEAR_RE = re.compile(r"^(\d{4})\.0+$")
+
+def vnorm_string(col: pd.Series, fill: str = "") -> pd.Series:
+    # Strip every cell once, then replace missing cells and placeholders with fill
+    s = col.astype("string").str.strip()
+    return s.where(~(s.isna() | s.isin(PLACEHOLDERS)), fill)
+
+def vnorm_id(col: pd.Series) -> pd.Series:
+    return vnorm_string(col)
+
+def vnorm_number_like(col: pd.Series) -> pd.Series:
+    # An all-numeric column with blanks is read as float64, so 20 comes through as 20.0;
+    # write integral values as integers. Object (text) columns are kept as is.
+    s = vnorm_string(col, fill="-")
+    if col.dtype.kind != "f":
+        return s
+    a = col.to_numpy(dtype=np.float64)
+    with np.errstate(invalid="ignore"):
+        is_int = np.isfinite(a) & (a % 1 == 0) & (np.abs(a) < 2**53)
+    if not is_int.any():
+        return s
+    ints = pd.Series(np.where(is_int, a, 0).astype(np.int64), index=col.index).astype("string")
+    return s.where(~is_int, ints)
+
+def vnorm_year(col: pd.Series) -> pd.Series:
+    # Years read as floats (e.g. a year column with blanks) come through as "2022.0"
+    return vnorm_string(col).str.replace(FLOAT_YEAR_RE, r"\1", regex=True)
+
+def load_sheets(xlsx_path: Path):
+    # Parse both sheets in one pass; prefer the Rust-based calamine reader
+    sheet_names = ["Project Sheet", "Distribution Sheet"]
+    try:
+        sheets = pd.read_excel(xlsx_path, sheet_name=sheet_names, engine="calamine")
+    except ImportError:
+        sheets = pd.read_excel(xlsx_path, sheet_name=sheet_names, engine="openpyxl")
+    proj, dist = sheets["Project Sheet"], sheets["Distribution Sheet"]
+
+    proj = proj.rename(columns={
+        "Project Name": "project_name",
+        "Project ID": "project_id",
+        "Subproject Name": "subproject_name",
+        "Subproject ID": "subproject_id",
+        "Year Announced": "year_announced",
+        "Effective Period": "effective_period",
+        "Country / Region": "country_region",
+        "Type & Status": "type_and_status",
+        "Numbers": "numbers",
+        "Targeted Firms or Parts of Value Chain": "targeted_entities",
+        "Notes / Description": "notes",
+        "Source": "sources",
+    })
+    proj = proj.loc[:, ~proj.columns.str.startswith("Unnamed")]
+    proj = proj.dropna(how="all")
+
+    dist = dist.rename(columns={
+        "Project Name": "project_name",
+        "Project ID": "project_id",
+        "Subproject Name": "subproject_name",
+        "Subproject ID": "subproject_id",
+        "Distribution Name": "distribution_name",
+        "Distribution ID": "distribution_id",
+        "Year Announced": "year_announced",
+        "Effective Period": "effective_period",
+        "Country": "country_region",
+        "Type & Status": "type_and_status",
+        "Numbers": "numbers",
+        "Targeted Firms or Parts of Value Chain": "targeted_entities",
+        "Notes / Description": "notes",
+        "Source": "sources",
+    })
+    dist = dist.dropna(how="all")
+
+    return proj, dist
+
+STRING_COLS = ["project_name","subproject_name","country_region","type_and_status",
+               "targeted_entities","notes","sources","effective_period"]
+
+def to_arrow_strings(df: pd.DataFrame, cols: List[str]) -> pd.DataFrame:
+    # Store normalized columns as contiguous Arrow UTF-8 buffers; keep as-is without pyarrow
+    for col in cols:
+        if col in df.columns:
+            try:
+                df[col] = df[col].astype("string[pyarrow]")
+            except ImportError:
+                return df
+    return df
+
+def prepare(proj: pd.DataFrame, dist: pd.DataFrame):
+    # Normalize strings
+    for col in STRING_COLS:
+        if col in proj.columns:
+            proj[col] = vnorm_string(proj[col])
+        if col in dist.columns:
+            dist[col] = vnorm_string(dist[col])
+
+    # Normalize IDs and year
+    for col in ["project_id","subproject_id","year_announced"]:
+        if col in proj.columns:
+            if col == "year_announced":
+                proj[col] = vnorm_year(proj[col])
+            else:
+                proj[col] = vnorm_id(proj[col])
+        if col in dist.columns:
+            if col == "year_announced":
+                dist[col] = vnorm_year(dist[col])
+            else:
+                dist[col] = vnorm_id(dist[col])
+
+    # Numbers default "-"
+    if "numbers" in proj.columns:
+        proj["numbers"] = vnorm_number_like(proj["numbers"])
+    if "numbers" in dist.columns:
+        dist["numbers"] = vnorm_number_like(dist["numbers"])
+
+    # Lowercased helpers for robust name matching
+    if "project_name" in proj.columns:
+        proj["project_name_lc"] = proj["project_name"].fillna("").str.lower()
+    if "project_name" in dist.columns:
+        dist["project_name_lc"] = dist["project_name"].fillna("").str.lower()
+
+    if "subproject_name" in proj.columns:
+        proj["subproject_name_lc"] = proj["subproject_name"].fillna("").str.lower()
+    if "subproject_name" in dist.columns:
+        dist["subproject_name_lc"] = dist["subproject_name"].fillna("").str.lower()
+
+    arrow_cols = STRING_COLS + ["project_id","subproject_id","year_announced","numbers",
+                                "project_name_lc","subproject_name_lc"]
+    proj = to_arrow_strings(proj, arrow_cols)
+    dist = to_arrow_strings(dist, arrow_cols)
+    return proj, dist
+
+PROJ_FIELDS = [
+    "project_name", "project_id", "year_announced", "effective_period",
+    "country_region", "type_and_status", "numbers", "targeted_entities",
+    "notes", "sources",  # <-- preserve Project Sheet sources
+    "subproject_name", "subproject_id",
+]
+DIST_FIELDS = [
+    "distribution_name", "distribution_id", "year_announced", "effective_period",
+    "country_region", "type_and_status", "numbers", "targeted_entities",
+    "notes", "sources",
+]
+
+STRICT_KEYS = ["project_id","subproject_id"]
+FALLBACK_KEYS = ["project_name_lc","subproject_name_lc","subproject_id"]
+KEY_COLS = ["project_id","subproject_id","project_name_lc","subproject_name_lc"]
+
+def encode_keys(proj: pd.DataFrame, dist: pd.DataFrame):
+    # Category-encode join keys with shared categories so matching compares integer codes
+    proj_keys = proj[KEY_COLS].copy()
+    dist_keys = dist[KEY_COLS].copy()
+    for col in KEY_COLS:
+        cats = pd.Index(pd.concat([proj_keys[col], dist_keys[col]], ignore_index=True).unique())
+        proj_keys[col] = pd.Categorical(proj_keys[col], categories=cats)
+        dist_keys[col] = pd.Categorical(dist_keys[col], categories=cats)
+    return proj_keys, dist_keys
+
+def combine_codes(proj_keys: pd.DataFrame, dist_keys: pd.DataFrame, cols: List[str]):
+    # Dense int64 id per distinct key tuple, shared across both frames (no radix packing to overflow)
+    both = pd.concat([proj_keys[cols], dist_keys[cols]], ignore_index=True)
+    codes = both.groupby(cols, sort=False, observed=True, dropna=False).ngroup().to_numpy(dtype=np.int64)
+    return codes[:len(proj_keys)], codes[len(proj_keys):]
+
+def match_kernel(pstrict, dstrict, pfall, dfall):
+    # CSR-style match: indices[offsets[i]:offsets[i+1]] are the dist rows for project row i
+    sorder = np.argsort(dstrict, kind="mergesort")
+    forder = np.argsort(dfall, kind="mergesort")
+    ssorted = dstrict[sorder]
+    fsorted = dfall[forder]
+    slo = np.searchsorted(ssorted, pstrict, side="left")
+    shi = np.searchsorted(ssorted, pstrict, side="right")
+    flo = np.searchsorted(fsorted, pfall, side="left")
+    fhi = np.searchsorted(fsorted, pfall, side="right")
+
+    # Use the strict run when it is non-empty, else the fallback run
+    use_strict = shi > slo
+    order = np.concatenate([sorder, forder])
+    start = np.where(use_strict, slo, len(sorder) + flo)
+    counts = np.where(use_strict, shi - slo, fhi - flo)
+
+    offsets = np.zeros(len(pstrict) + 1, dtype=np.int64)
+    np.cumsum(counts, out=offsets[1:])
+    pos = np.repeat(start - offsets[:-1], counts) + np.arange(offsets[-1])
+    return offsets, order[pos]
+
+def match_distributions(proj: pd.DataFrame, dist: pd.DataFrame):
+    # Strict match on STRICT_KEYS first; fallback to names (case-insensitive) + subproject_id
+    proj_keys, dist_keys = encode_keys(proj, dist)
+    pstrict, dstrict = combine_codes(proj_keys, dist_keys, STRICT_KEYS)
+    pfall, dfall = combine_codes(proj_keys, dist_keys, FALLBACK_KEYS)
+    return match_kernel(pstrict, dstrict, pfall, dfall)
+
+def to_records(frame: pd.DataFrame, fields: List[str]) -> List[Dict[str, Any]]:
+    # Build all output dicts in one pass; missing columns default to "" and numbers to "-"
+    frame = frame.reindex(columns=fields, fill_value="")
+    frame["numbers"] = frame["numbers"].where(frame["numbers"].astype(str).str.strip() != "", "-")
+    return frame.to_dict(orient="records")
+
+def iter_entries(proj: pd.DataFrame, dist: pd.DataFrame) -> Iterator[Dict[str, Any]]:
+    # Build output dicts one chunk of project rows at a time, so at most ENTRY_CHUNK entries are in memory
+    offsets, indices = match_distributions(proj, dist)
+    for start in range(0, len(proj), ENTRY_CHUNK):
+        stop = min(start + ENTRY_CHUNK, len(proj))
+        base = offsets[start]
+        dist_records = to_records(dist.iloc[indices[base:offsets[stop]]], DIST_FIELDS)
+        for i, entry in enumerate(to_records(proj.iloc[start:stop], PROJ_FIELDS), start):
+            entry["distributions"] = dist_records[offsets[i] - base:offsets[i + 1] - base]
+            yield entry
+
+def dump_entry(entry: Dict[str, Any], pretty: bool = False) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(entry, option=orjson.OPT_INDENT_2 if pretty else None)
+    if pretty:
+        return json.dumps(entry, ensure_ascii=False, indent=2).encode("utf-8")
+    return json.dumps(entry, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+def write_json(entries: Iterable[Dict[str, Any]], out_path: Path, pretty: bool = False) -> int:
+    # Stream one entry at a time; compact by default, pretty matches an indent=2 dump of the whole list
+    count = 0
+    with out_path.open("wb") as f:
+        f.write(b"[")
+        for entry in entries:
+            if pretty:
+                f.write(b"\n  " if count == 0 else b",\n  ")
+                f.write(dump_entry(entry, pretty=True).replace(b"\n", b"\n  "))
+            else:
+                f.write(b"" if count == 0 else b",")
+                f.write(dump_entry(entry))
+            count += 1
+        f.write(b"\n]" if pretty and count else b"]")
+    return count
+
+def prune_cache(cache_dir: Path, prefix: str, keep: List[Path]):
+    # Drop this workbook's older cache entries so .cache/ holds one pair per workbook
+    for path in cache_dir.iterdir():
+        if path.name.startswith(prefix) and path.suffix == ".parquet" and path not in keep:
+            path.unlink(missing_ok=True)
+
+def load_prepared(xlsx_path: Path, cache_dir: Optional[Path] = None):
+    # Reuse prepared frames from a Parquet cache next to the workbook, keyed by its mtime and size
+    # (and this module's mtime, so changes to prepare() invalidate old entries)
+    if cache_dir is None:
+        cache_dir = xlsx_path.parent / CACHE_DIR_NAME
+    st = xlsx_path.stat()
+    module_mtime = Path(__file__).stat().st_mtime
+    key = hashlib.md5(f"{st.st_mtime}-{st.st_size}-{module_mtime}".encode()).hexdigest()
+    prefix = f"{xlsx_path.stem}-"
+    proj_path = cache_dir / f"{prefix}proj-{key}.parquet"
+    dist_path = cache_dir / f"{prefix}dist-{key}.parquet"
+    if proj_path.exists() and dist_path.exists():
+        try:
+            return pd.read_parquet(proj_path), pd.read_parquet(dist_path)
+        except Exception:
+            # Unreadable or corrupt cache (or no parquet engine): treat as a miss and rebuild
+            proj_path.unlink(missing_ok=True)
+            dist_path.unlink(missing_ok=True)
+
+    proj, dist = load_sheets(xlsx_path)
+    proj, dist = prepare(proj, dist)
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        for frame, path in ((proj, proj_path), (dist, dist_path)):
+            # Write under a temp name and rename, so a killed run never leaves a partial file
+            tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+            try:
+                frame.to_parquet(tmp_path)
+                os.replace(tmp_path, path)
+            finally:
+                tmp_path.unlink(missing_ok=True)
+        prune_cache(cache_dir, prefix, keep=[proj_path, dist_path])
+    except (ImportError, ValueError, TypeError, OSError):
+        # Caching is best-effort; drop partial entries and carry on
+        proj_path.unlink(missing_ok=True)
+        dist_path.unlink(missing_ok=True)
+    return proj, dist
+
+def convert(xlsx_path: Path, out_path: Path, pretty: bool = False) -> int:
+    proj, dist = load_prepared(xlsx_path)
+    return write_json(iter_entries(proj, dist), out_path, pretty=pretty)